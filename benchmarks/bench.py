@@ -0,0 +1,178 @@
+"""
+Microbenchmarks of board, piece and move primitives, and of package import time.
+
+Run from the repository root:
+    python -m benchmarks.bench --output results.json
+    python -m benchmarks.bench --save-baseline benchmarks/baseline.json
+    python -m benchmarks.bench --baseline benchmarks/baseline.json --tolerance 0.2
+
+Exits with status 1 when a benchmark is slower than the baseline by more than the tolerance.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import timeit
+from typing import Callable, Dict
+
+from src.chess.board import GameBoard
+from src.chess.cli import Chess
+from src.chess.moves import GameMoves
+from src.chess.pieces import Pawn
+
+# Fixed positions, as moves played from the starting position
+positions = {
+    'start': (),
+    'open': (('E2', 'E4'), ('E7', 'E5'), ('G1', 'F3'), ('B8', 'C6'), ('F1', 'C4'), ('G8', 'F6'), ('D2', 'D3'),
+             ('F8', 'C5')),
+}
+
+
+def create_board(name: str) -> GameBoard:
+    board = GameBoard()
+    for old_location, new_location in positions[name]:
+        GameMoves.move(board, old_location, new_location)
+    return board
+
+
+def get_all_moves(board: GameBoard) -> Callable[[], None]:
+    def run():
+        board.move_cache.clear()  # measure move generation rather than cache lookups
+        GameMoves.get_all_moves(board, board.turn)
+    return run
+
+
+def move(board: GameBoard) -> Callable[[], None]:
+    pawn = board['E2']
+    history = board.history
+
+    def run():
+        GameMoves.move(board, 'E2', 'E4')
+        # undo the move
+        board['E2'], board['E4'] = pawn, None
+        board.turn = 'white'
+        board.en_passant = None
+        board.history = history
+    return run
+
+
+def benchmarks() -> Dict[str, Callable[[], None]]:
+    """
+    Benchmark functions by name
+    """
+    start = create_board('start')
+    game = Chess(board=create_board('open'))
+    return {
+        'board_init': GameBoard,
+        'board_copy': start.copy,
+        'board_getitem': lambda: start['E4'],
+        'board_setitem': lambda: start.__setitem__('E4', None),
+        'piece_init': lambda: Pawn('white'),
+        'display': game.display,
+        'move': move(create_board('start')),
+        'get_moves_cached': lambda: GameMoves.get_moves(start, 'E1'),
+        'get_all_moves_start': get_all_moves(start),
+        'get_all_moves_open': get_all_moves(game.board),
+    }
+
+
+def measure(func: Callable[[], None], repeat: int = 5, min_time: float = 0.2) -> dict:
+    """
+    Time func, running it often enough that each repetition takes at least min_time seconds.
+
+    :return: best and mean time per call in microseconds
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    times = [t / number * 1e6 for t in timer.repeat(repeat=repeat, number=number)]
+    return {'best_us': min(times), 'mean_us': sum(times) / len(times), 'calls': number}
+
+
+def measure_import(module: str, repeat: int = 5) -> dict:
+    """
+    Time importing module in a fresh interpreter, as reported by python -X importtime.
+
+    :return: best and mean cumulative import time in microseconds
+    """
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                                stderr=subprocess.PIPE, universal_newlines=True, check=True).stderr
+        for line in output.splitlines():
+            # import time: self [us] | cumulative | imported package
+            fields = line.split('|')
+            if len(fields) == 3 and fields[2].strip() == module:
+                times.append(int(fields[1]))
+    return {'best_us': min(times), 'mean_us': sum(times) / len(times), 'calls': repeat}
+
+
+imports = {
+    'import_package': 'src.chess',
+    'import_moves': 'src.chess.moves',
+}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Names of benchmarks slower than the baseline by more than tolerance (e.g. 0.2 for 20%)
+    """
+    regressions = []
+    for name, result in results['benchmarks'].items():
+        if name not in baseline['benchmarks']:
+            continue
+        expected = baseline['benchmarks'][name]['best_us']
+        if result['best_us'] > expected * (1 + tolerance):
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Run chess microbenchmarks')
+    parser.add_argument('--output', help='write results as JSON to this file')
+    parser.add_argument('--baseline', help='JSON results to compare against')
+    parser.add_argument('--save-baseline', help='write results as the new baseline to this file')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed slowdown relative to the baseline')
+    parser.add_argument('--filter', default='', help='only run benchmarks containing this string')
+    args = parser.parse_args(argv)
+
+    results = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'benchmarks': {},
+    }
+    for name, func in benchmarks().items():
+        if args.filter not in name:
+            continue
+        result = measure(func)
+        results['benchmarks'][name] = result
+        print(f'{name:24} {result["best_us"]:12.2f} us')
+    for name, module in imports.items():
+        if args.filter not in name:
+            continue
+        result = measure_import(module)
+        results['benchmarks'][name] = result
+        print(f'{name:24} {result["best_us"]:12.2f} us')
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w') as fo:
+                json.dump(results, fo, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as fo:
+            baseline = json.load(fo)
+        regressions = compare(results, baseline, args.tolerance)
+        for name in regressions:
+            expected = baseline['benchmarks'][name]['best_us']
+            actual = results['benchmarks'][name]['best_us']
+            print(f'REGRESSION {name}: {actual:.2f} us vs baseline {expected:.2f} us (+{actual / expected - 1:.0%})')
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,10 +1,8 @@
 """
 Chess
 """
-from .board import GameBoard
-from .cli import Chess
-from .moves import GameMoves
-from .pieces import King, Queen, Rook, Bishop, Knight, Pawn
+import sys
+from importlib import import_module
 
 
 __version__ = '1.0'
@@ -12,6 +10,7 @@ __all__ = [
     'GameBoard',
     'Chess',
     'GameMoves',
+    'PositionDatabase',
     'King',
     'Queen',
     'Rook',
@@ -19,3 +18,38 @@ __all__ = [
     'Knight',
     'Pawn',
 ]
+
+# Submodule defining each public name. Submodules are imported on first access so `import chess` stays cheap.
+_submodules = {
+    'GameBoard': 'board',
+    'Chess': 'cli',
+    'GameMoves': 'moves',
+    'PositionDatabase': 'database',
+    'King': 'pieces',
+    'Queen': 'pieces',
+    'Rook': 'pieces',
+    'Bishop': 'pieces',
+    'Knight': 'pieces',
+    'Pawn': 'pieces',
+}
+
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ (PEP 562) requires Python 3.7, import everything up front instead
+    for _name, _submodule in _submodules.items():
+        globals()[_name] = getattr(import_module(f'.{_submodule}', __name__), _name)
+    del _name, _submodule
+
+
+def __getattr__(name):
+    try:
+        submodule = _submodules[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    value = getattr(import_module(f'.{submodule}', __name__), name)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,8 @@
 import re
-from typing import Set
-from copy import deepcopy
+import struct
+from collections import OrderedDict
+from typing import Hashable, Optional, Set
+from copy import copy
 from .pieces import King, Queen, Rook, Bishop, Knight, Pawn
 
 Location = str
@@ -8,6 +10,124 @@ Color = str
 Locations = Set[Location]
 
 
+class MoveCache:
+    """
+    Bounded LRU cache of move sets for a single board.
+
+    Entries belong to one board version. The cache is emptied as soon as it is accessed with a newer version.
+    """
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable, version: int) -> Optional[Locations]:
+        """
+        Cached value for key (None if it is not cached for this version)
+        """
+        if version != self.version:
+            self._entries.clear()
+            self.version = version
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, version: int, value: Locations) -> None:
+        """
+        Cache value for key. Evicts the least recently used entry when full.
+        """
+        if version != self.version:
+            self._entries.clear()
+            self.version = version
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _write_back(method):
+    """
+    Wrap a list method of History so changes are written back to the board
+    """
+    def wrapper(self, *args, **kwargs):
+        self._refresh()
+        result = method(self, *args, **kwargs)
+        board = self._board
+        board.history = self
+        self._node = board._history_node
+        board._history_view = self
+        return result
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+class History(list):
+    """
+    The moves played on a board, oldest first.
+
+    Behaves as a list, but changes are written back to the board's linked chain of entries.
+    Appending only adds a link; other changes rebuild the chain.
+    """
+    def __init__(self, board: 'GameBoard'):
+        super().__init__()
+        self._board = board
+        self._node = None
+        self._refresh()
+
+    def _refresh(self) -> None:
+        """
+        Reload the entries if the board's history changed since they were read
+        """
+        node = self._board._history_node
+        if node is self._node:
+            return
+        entries = []
+        self._node = node
+        while node is not None:
+            entry, node = node
+            entries.append(entry)
+        entries.reverse()
+        list.__init__(self, entries)
+
+    def append(self, entry: str) -> None:
+        self._refresh()
+        list.append(self, entry)
+        board = self._board
+        board.add_history(entry)
+        self._node = board._history_node
+        board._history_view = self
+
+    extend = _write_back(list.extend)
+    insert = _write_back(list.insert)
+    pop = _write_back(list.pop)
+    remove = _write_back(list.remove)
+    clear = _write_back(list.clear)
+    sort = _write_back(list.sort)
+    reverse = _write_back(list.reverse)
+    __setitem__ = _write_back(list.__setitem__)
+    __delitem__ = _write_back(list.__delitem__)
+    __iadd__ = _write_back(list.__iadd__)
+    __imul__ = _write_back(list.__imul__)
+
+
 class GameBoard(dict):
     """
     Chess game board (8x8).
@@ -36,6 +156,9 @@ class GameBoard(dict):
         }
     }
 
+    # bumped on every change to the board. Class default lets pickle restore squares before the instance state
+    version = 0
+
     default_options = {
         'turn': 'white',  # starting turn
         'history': list(),  # starting history
@@ -46,15 +169,7 @@ class GameBoard(dict):
         """
         Create starting game board
         """
-        default_options = deepcopy(self.default_options)  # ensure self.default_options is not modified
-
-        # Update default_options with new values from user_options
-        # Ignore user_option keys that do not appear in default_options
-        # See https://stackoverflow.com/questions/14941115/update-dict-without-adding-new-keys
-        default_options.update((key, user_options[key]) for key in default_options.keys() & user_options.keys())
-
-        for key, value in default_options.items():
-            setattr(self, key, value)
+        self._set_options(user_options)
 
         # create dict with empty board positions
         d = {col + row: None for row in self.rows for col in self.cols}
@@ -63,10 +178,29 @@ class GameBoard(dict):
         for color in self.initial_positions.keys():
             for piece_type, locations in self.initial_positions[color].items():
                 for location in locations:
-                    d[location] = piece_type(color)
+                    d[location] = piece_type.shared(color)
 
         super().__init__(d)
 
+    def _set_options(self, user_options):
+        """
+        Set board attributes from default_options and user_options
+        """
+        # version is bumped on every change to the board and invalidates move_cache
+        self.version = 0
+        self.move_cache = MoveCache()
+
+        # ensure self.default_options is not modified
+        default_options = {key: copy(value) for key, value in self.default_options.items()}
+
+        # Update default_options with new values from user_options
+        # Ignore user_option keys that do not appear in default_options
+        # See https://stackoverflow.com/questions/14941115/update-dict-without-adding-new-keys
+        default_options.update((key, user_options[key]) for key in default_options.keys() & user_options.keys())
+
+        for key, value in default_options.items():
+            setattr(self, key, value)
+
     def __setitem__(self, key, value):
         """
         Prevent user from modifying keys
@@ -74,6 +208,71 @@ class GameBoard(dict):
         if not re.match('[A-H][1-8]', key):
             raise KeyError(f'Invalid chess board position: {key}')
         super().__setitem__(key, value)
+        self.version += 1
+
+    def copy(self) -> 'GameBoard':
+        """
+        Cheap copy of the board.
+
+        Only the squares are duplicated. Pieces are immutable and shared with the original board.
+        The history is a linked chain of entries, so both boards share it and later moves only add new links.
+        """
+        board = type(self).__new__(type(self))
+        dict.__init__(board, self)
+        board.version = 0
+        board.move_cache = MoveCache()
+        board.turn = self.turn
+        board._en_passant = self._en_passant
+        board._history_node = self._history_node
+        board._history_view = None  # History lists belong to a single board
+        return board
+
+    __copy__ = copy
+
+    def __getstate__(self):
+        # store the history as a list: pickling a long linked chain would exceed the recursion limit
+        state = dict(self.__dict__)
+        state['_history_node'] = None
+        state['_history_view'] = list(self.history)
+        return state
+
+    def __setstate__(self, state):
+        history = state.pop('_history_view')
+        self.__dict__.update(state)
+        self.history = history
+
+    @property
+    def history(self) -> History:
+        """
+        The moves played, oldest first. Changes to the list are written back to the board.
+        """
+        if self._history_view is None:
+            self._history_view = History(self)
+        return self._history_view
+
+    @history.setter
+    def history(self, val):
+        self._history_node = None
+        for entry in val:
+            self._history_node = (entry, self._history_node)
+        self._history_view = None
+
+    def add_history(self, entry: str) -> None:
+        """
+        Append to the history. Boards sharing the history with this one are not affected.
+        """
+        self._history_node = (entry, self._history_node)  # (entry, previous node)
+        self._history_view = None
+
+    @property
+    def en_passant(self):
+        return self._en_passant
+
+    @en_passant.setter
+    def en_passant(self, val):
+        # en-passant square changes which moves pawns are allowed
+        self._en_passant = val
+        self.version += 1
 
     def __getitem__(self, item):
         """
@@ -82,3 +281,111 @@ class GameBoard(dict):
         if not re.match('[A-H][1-8]', item):
             raise KeyError(f'Invalid chess board position: {item}')
         return super().__getitem__(item)
+
+    def to_bytes(self) -> bytes:
+        """
+        Pack the position into PACKED_SIZE bytes.
+
+        Layout: 64 piece nibbles (A1 to H8), a little-endian 64-bit has_moved mask,
+        a flags byte (bit 0 set when black is to move) and the en-passant square index (255 if none).
+        History is not included.
+        """
+        return packed_format.pack(*self._packed_fields())
+
+    def _packed_fields(self) -> tuple:
+        """
+        Values of the fields in packed_format
+        """
+        nibbles = bytearray(32)
+        has_moved = 0
+        for i, location in enumerate(squares):
+            piece = dict.__getitem__(self, location)
+            if piece is not None:
+                code = piece_codes[type(piece)] | (8 if piece.color == 'black' else 0)
+                nibbles[i // 2] |= code << 4 if i % 2 == 0 else code
+                if piece.has_moved:
+                    has_moved |= 1 << i
+        flags = 1 if self.turn == 'black' else 0
+        en_passant = 255 if self.en_passant is None else square_indexes[self.en_passant]
+        return bytes(nibbles), has_moved, flags, en_passant
+
+    def pack_into(self, buffer, offset: int = 0) -> None:
+        """
+        Write the packed position (see to_bytes) into a writable buffer such as a bytearray, mmap or shared memory
+        """
+        packed_format.pack_into(buffer, offset, *self._packed_fields())
+
+    @classmethod
+    def from_bytes(cls, data, offset: int = 0) -> 'GameBoard':
+        """
+        Create a board from a packed position (see to_bytes).
+
+        :param data: bytes-like object (bytes, bytearray, memoryview, mmap, ...). It is read in place, not copied.
+        :param offset: position of the packed board within data
+        """
+        nibbles, has_moved, flags, en_passant = packed_format.unpack_from(data, offset)
+        if en_passant != 255 and en_passant >= len(squares):
+            raise ValueError(f'Invalid packed en-passant square: {en_passant}')
+        board = cls.__new__(cls)
+        board._set_options({
+            'turn': 'black' if flags & 1 else 'white',
+            'en_passant': None if en_passant == 255 else squares[en_passant],
+        })
+
+        pieces = {}
+        for i, location in enumerate(squares):
+            code = nibbles[i // 2] >> 4 if i % 2 == 0 else nibbles[i // 2] & 0xF
+            if code == 0:
+                pieces[location] = None
+            else:
+                piece_type = code_pieces.get(code & 7)
+                if piece_type is None:
+                    raise ValueError(f'Invalid packed piece code at {location}: {code}')
+                color = 'black' if code & 8 else 'white'
+                pieces[location] = piece_type.shared(color, has_moved=bool(has_moved >> i & 1))
+        dict.__init__(board, pieces)
+        return board
+
+
+class PackedPositions:
+    """
+    Array of packed positions stored in a buffer (bytearray, mmap, multiprocessing shared memory, ...).
+
+    Boards are packed and unpacked in place, so the buffer can be shared between processes without pickling.
+    """
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+    @classmethod
+    def create(cls, count: int) -> 'PackedPositions':
+        """
+        Array backed by a new bytearray with room for count positions
+        """
+        return cls(bytearray(count * PACKED_SIZE))
+
+    def __len__(self):
+        return len(self.buffer) // PACKED_SIZE
+
+    def _offset(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('PackedPositions index out of range')
+        return index * PACKED_SIZE
+
+    def __getitem__(self, index: int) -> GameBoard:
+        return GameBoard.from_bytes(self.buffer, self._offset(index))
+
+    def __setitem__(self, index: int, board: GameBoard) -> None:
+        board.pack_into(self.buffer, self._offset(index))
+
+
+# Squares in packing order (A1, B1, ..., H8)
+squares = tuple(col + row for row in GameBoard.rows for col in GameBoard.cols)
+square_indexes = {location: i for i, location in enumerate(squares)}
+
+piece_codes = {King: 1, Queen: 2, Rook: 3, Bishop: 4, Knight: 5, Pawn: 6}  # black pieces have bit 3 set
+code_pieces = {code: piece_type for piece_type, code in piece_codes.items()}
+
+packed_format = struct.Struct('<32sQBB')
+PACKED_SIZE = packed_format.size
@@ -0,0 +1,201 @@
+import sqlite3
+from hashlib import blake2b
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from .board import GameBoard, Location
+from .moves import GameMoves
+from .pieces import King, Queen, Rook, Bishop, Knight, Pawn
+
+Move = Tuple[Location, Location]
+
+# Order used when building material signatures (most valuable piece first)
+material_order = (King, Queen, Rook, Bishop, Knight, Pawn)
+material_characters = {King: 'K', Queen: 'Q', Rook: 'R', Bishop: 'B', Knight: 'N', Pawn: 'P'}
+
+
+def position_key(board: GameBoard) -> str:
+    """
+    String uniquely describing the position on the board.
+
+    Contains one character per square (A1 to H8, '.' if empty, upper case for white, lower case for black),
+    followed by the side to move and the en-passant square ('-' if there is none).
+    """
+    squares = []
+    for row in GameBoard.rows:
+        for col in GameBoard.cols:
+            piece = board[col + row]
+            if piece is None:
+                squares.append('.')
+            elif piece.color == 'white':
+                squares.append(piece.character)
+            else:
+                squares.append(piece.character.lower())
+    return ''.join(squares) + board.turn[0] + (board.en_passant or '-')
+
+
+def position_hash(board: GameBoard) -> int:
+    """
+    Stable 64-bit hash of the position on the board.
+
+    Unlike hash(), the value does not depend on the interpreter's hash seed so it can be stored on disk.
+    """
+    digest = blake2b(position_key(board).encode('ascii'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)  # sqlite integers are signed 64-bit
+
+
+def material_signature(board: GameBoard) -> str:
+    """
+    Material on the board, e.g. 'KRPPvKNP' for king, rook and two pawns against king, knight and pawn.
+    """
+    counts = {'white': dict.fromkeys(material_order, 0), 'black': dict.fromkeys(material_order, 0)}
+    for piece in board.values():
+        if piece is not None:
+            counts[piece.color][type(piece)] += 1
+
+    def side(color):
+        return ''.join(material_characters[piece_type] * counts[color][piece_type] for piece_type in material_order)
+
+    return side('white') + 'v' + side('black')
+
+
+class PositionDatabase:
+    """
+    SQLite backed store of games and the positions reached in them.
+
+    Positions are indexed by position hash, material signature and side to move.
+    """
+    schema = (
+        'CREATE TABLE IF NOT EXISTS games ('
+        ' id INTEGER PRIMARY KEY,'
+        ' white TEXT,'
+        ' black TEXT,'
+        ' result TEXT,'
+        ' moves TEXT'
+        ')',
+        'CREATE TABLE IF NOT EXISTS positions ('
+        ' hash INTEGER NOT NULL,'
+        ' material TEXT NOT NULL,'
+        ' turn TEXT NOT NULL,'
+        ' game_id INTEGER NOT NULL REFERENCES games(id),'
+        ' ply INTEGER NOT NULL'
+        ')',
+        'CREATE INDEX IF NOT EXISTS positions_hash ON positions (hash)',
+        'CREATE INDEX IF NOT EXISTS positions_material ON positions (material, turn)',
+    )
+
+    def __init__(self, path: str = ':memory:', batch_size: int = 1000):
+        """
+        Open (or create) a position database.
+
+        :param path: sqlite database file. Defaults to an in-memory database.
+        :param batch_size: number of games inserted per transaction by add_games
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(path)
+        if path != ':memory:':
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute('PRAGMA synchronous=NORMAL')
+        with self.connection:
+            for statement in self.schema:
+                self.connection.execute(statement)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def add_game(self, moves: Sequence[Move], white: str = '', black: str = '', result: str = '*') -> int:
+        """
+        Replay a game from the starting position and store every position reached.
+
+        :param moves: list of (old_location, new_location) pairs
+        :return: id of the new game
+        """
+        with self.connection:
+            return self._insert_game(moves, white, black, result)
+
+    def add_games(self, games: Iterable[dict]) -> List[int]:
+        """
+        Bulk insert games, committing once every batch_size games.
+
+        :param games: dicts with a 'moves' key and optional 'white', 'black' and 'result' keys
+        :return: ids of the new games
+        """
+        game_ids = []
+        pending = 0
+        try:
+            for game in games:
+                game_ids.append(self._insert_game(**game))
+                pending += 1
+                if pending >= self.batch_size:
+                    self.connection.commit()
+                    pending = 0
+        except BaseException:
+            self.connection.rollback()
+            raise
+        self.connection.commit()
+        return game_ids
+
+    def _insert_game(self, moves: Sequence[Move], white: str = '', black: str = '', result: str = '*') -> int:
+        """
+        Insert a game without committing
+        """
+        moves = [(old_location.upper(), new_location.upper()) for old_location, new_location in moves]
+        cursor = self.connection.execute(
+            'INSERT INTO games (white, black, result, moves) VALUES (?, ?, ?, ?)',
+            (white, black, result, ' '.join(old + new for old, new in moves)),
+        )
+        game_id = cursor.lastrowid
+
+        board = GameBoard()
+        rows = [self._position_row(board, game_id, 0)]
+        for ply, (old_location, new_location) in enumerate(moves, start=1):
+            GameMoves.move(board, old_location, new_location)
+            rows.append(self._position_row(board, game_id, ply))
+        self.connection.executemany('INSERT INTO positions (hash, material, turn, game_id, ply) VALUES (?, ?, ?, ?, ?)',
+                                    rows)
+        return game_id
+
+    @staticmethod
+    def _position_row(board: GameBoard, game_id: int, ply: int) -> tuple:
+        return position_hash(board), material_signature(board), board.turn, game_id, ply
+
+    def get_game(self, game_id: int) -> Optional[dict]:
+        """
+        Stored game with the specified id (None if there is no such game).
+        """
+        row = self.connection.execute('SELECT white, black, result, moves FROM games WHERE id = ?',
+                                      (game_id,)).fetchone()
+        if row is None:
+            return None
+        white, black, result, moves = row
+        return {
+            'white': white,
+            'black': black,
+            'result': result,
+            'moves': [(move[:2], move[2:]) for move in moves.split()],
+        }
+
+    def games_with_position(self, board: GameBoard) -> List[int]:
+        """
+        Ids of all games reaching the position on the board.
+        """
+        rows = self.connection.execute('SELECT DISTINCT game_id FROM positions WHERE hash = ? ORDER BY game_id',
+                                       (position_hash(board),))
+        return [game_id for game_id, in rows]
+
+    def positions_with_material(self, signature: str, turn: Optional[str] = None) -> List[Tuple[int, int]]:
+        """
+        (game_id, ply) of all positions with the material signature, optionally filtered by side to move.
+        """
+        if turn is None:
+            rows = self.connection.execute('SELECT game_id, ply FROM positions WHERE material = ?', (signature,))
+        else:
+            rows = self.connection.execute('SELECT game_id, ply FROM positions WHERE material = ? AND turn = ?',
+                                           (signature, turn))
+        return rows.fetchall()
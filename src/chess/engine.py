@@ -0,0 +1,212 @@
+import random
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .board import GameBoard, Color, Location
+from .moves import GameMoves, Move, move_tables, rook_directions, bishop_directions
+from .pieces import King, Queen, Rook, Bishop, Knight, Pawn
+
+MATE_SCORE = 100000
+
+piece_values = {
+    King: 0,  # kings are never traded, losing the king is scored as MATE_SCORE
+    Queen: 900,
+    Rook: 500,
+    Bishop: 330,
+    Knight: 320,
+    Pawn: 100,
+}
+
+
+# Values used by the exchange evaluation, where the king is the last piece to join a capture sequence
+exchange_values = dict(piece_values)
+exchange_values[King] = MATE_SCORE
+
+
+class SearchStopped(Exception):
+    """
+    Raised inside the search when it is asked to stop
+    """
+
+
+def evaluate(board: GameBoard) -> int:
+    """
+    Material balance (in centipawns) from the point of view of the side to move.
+    """
+    score = 0
+    for piece in board.values():
+        if piece is not None:
+            value = piece_values[type(piece)]
+            score += value if piece.color == board.turn else -value
+    return score
+
+
+def _attackers(board: GameBoard, location: Location, color: Color, removed: set) -> List[Tuple[int, Location]]:
+    """
+    (exchange value, location) of every piece of the specified color attacking location.
+
+    Squares in removed are treated as empty, which uncovers x-ray attackers behind sliding pieces.
+    """
+    tables = move_tables()
+    attackers = []
+
+    def piece_at(square):
+        return None if square in removed else board.get(square)
+
+    # sliding pieces, pawns and kings
+    pawn_row = -1 if color == 'white' else 1  # pawns attack towards the enemy
+    for directions, sliders in ((rook_directions, (Rook, Queen)), (bishop_directions, (Bishop, Queen))):
+        for dc, dr in directions:
+            for distance, square in enumerate(tables['rays'][location][dc, dr], start=1):
+                piece = piece_at(square)
+                if piece is not None:
+                    if piece.color == color:
+                        if isinstance(piece, sliders) \
+                                or distance == 1 and isinstance(piece, King) \
+                                or distance == 1 and isinstance(piece, Pawn) and dc != 0 and dr == pawn_row:
+                            attackers.append((exchange_values[type(piece)], square))
+                    break
+
+    # knights
+    for square in tables['knight'][location]:
+        piece = piece_at(square)
+        if isinstance(piece, Knight) and piece.color == color:
+            attackers.append((exchange_values[Knight], square))
+
+    return attackers
+
+
+def static_exchange_eval(board: GameBoard, from_location: Location, to_location: Location) -> int:
+    """
+    Material won (in centipawns) by capturing on to_location with the piece on from_location,
+    assuming both sides keep recapturing with their least valuable piece while it pays off.
+
+    Attackers hidden behind sliding pieces (x-rays) join the exchange once the pieces in front have captured.
+    The board is not modified.
+    """
+    from_location = from_location.upper()
+    to_location = to_location.upper()
+    piece = board[from_location]
+    if piece is None:
+        raise ValueError(f'No piece at {from_location}')
+    target = board[to_location]
+
+    gains = [exchange_values[type(target)] if target is not None else 0]
+    removed = {from_location}
+    attacker_value = exchange_values[type(piece)]  # value of the piece standing on to_location
+    color = 'black' if piece.color == 'white' else 'white'
+    while True:
+        attackers = _attackers(board, to_location, color, removed)
+        if not attackers:
+            break
+        gains.append(attacker_value - gains[-1])
+        attacker_value, square = min(attackers)
+        removed.add(square)
+        color = 'black' if color == 'white' else 'white'
+
+    # each side may stop capturing when continuing loses material
+    for i in range(len(gains) - 1, 0, -1):
+        gains[i - 1] = -max(-gains[i - 1], gains[i])
+    return gains[0]
+
+
+def order_moves(board: GameBoard, moves: Iterable[Move]) -> List[Move]:
+    """
+    Sort moves for the search: winning captures, quiet moves and then losing captures.
+    """
+    def exchange(move):
+        if move.capture is None or 'en_passant' in move.flags:
+            return 0
+        return static_exchange_eval(board, move.from_location, move.to_location)
+
+    return sorted(moves, key=exchange, reverse=True)
+
+
+def has_king(board: GameBoard, color: Color) -> bool:
+    """
+    Check if the specified color still has its king.
+
+    The move generator does not detect checkmate, so games are lost by having the king captured.
+    """
+    return any(isinstance(piece, King) and piece.color == color for piece in board.values())
+
+
+def play_move(board: GameBoard, move: Move) -> GameBoard:
+    """
+    New board with the move played. The original board is left unchanged.
+    """
+    child = board.copy()
+    GameMoves.move(child, move.from_location, move.to_location)
+    return child
+
+
+def negamax(board: GameBoard, depth: int, alpha: int = -MATE_SCORE, beta: int = MATE_SCORE,
+            stop=None, rng: Optional[random.Random] = None) -> Tuple[int, List[Move]]:
+    """
+    Alpha-beta search of the position.
+
+    :param depth: remaining search depth in plies
+    :param stop: optional threading.Event. SearchStopped is raised once it is set
+    :param rng: optional random.Random. Shuffles the moves of this position before ordering them,
+        so ties between equally scored moves are broken at random rather than by generation order.
+    :return: score from the point of view of the side to move and the principal variation
+    """
+    if stop is not None and stop.is_set():
+        raise SearchStopped
+    if not has_king(board, board.turn):
+        return -MATE_SCORE, []
+    if depth == 0:
+        return evaluate(board), []
+
+    best_score = None
+    best_line = []
+    moves = GameMoves.iter_moves(board, board.turn)
+    if rng is not None:
+        moves = list(moves)
+        rng.shuffle(moves)
+    for move in order_moves(board, moves):
+        score, line = negamax(play_move(board, move), depth - 1, -beta, -alpha, stop)
+        score = -score
+        if best_score is None or score > best_score:
+            best_score = score
+            best_line = [move] + line
+        alpha = max(alpha, score)
+        if alpha >= beta:
+            break
+
+    if best_score is None:  # no moves available
+        return 0, []
+    return best_score, best_line
+
+
+def iterative_deepening(board: GameBoard, max_depth: int, stop=None,
+                        rng: Optional[random.Random] = None) -> Iterator[Tuple[int, int, List[Move]]]:
+    """
+    Search the position at increasing depths.
+
+    Yields (depth, score, principal variation) after each completed depth.
+    Stops quietly when the stop event is set.
+
+    :param rng: optional random.Random used to break ties between equally scored root moves
+    """
+    for depth in range(1, max_depth + 1):
+        try:
+            score, line = negamax(board, depth, stop=stop, rng=rng)
+        except SearchStopped:
+            return
+        yield depth, score, line
+        if abs(score) == MATE_SCORE:  # searching deeper will not change the result
+            return
+
+
+def search(board: GameBoard, depth: int, stop=None, rng: Optional[random.Random] = None) -> Tuple[int, Optional[Move]]:
+    """
+    Best move found by searching to the specified depth (None if there are no moves).
+
+    :param rng: optional random.Random used to break ties between equally scored moves
+    :return: score and best move
+    """
+    score, best_move = 0, None
+    for _, score, line in iterative_deepening(board, depth, stop, rng):
+        if line:
+            best_move = line[0]
+    return score, best_move
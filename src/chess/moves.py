@@ -1,7 +1,58 @@
+from functools import lru_cache
+from typing import Iterator, NamedTuple, Optional, Tuple
+
 from .pieces import King, Queen, Rook, Bishop, Knight, Pawn, GamePiece
 from .board import GameBoard, Location, Locations, Color
 
 
+class Move(NamedTuple):
+    """
+    A single move of a piece.
+
+    flags may contain 'en_passant' (pawn captures en-passant) or 'double_push' (pawn moves forward 2 spaces).
+    """
+    from_location: Location
+    to_location: Location
+    piece: GamePiece
+    capture: Optional[GamePiece] = None
+    flags: Tuple[str, ...] = ()
+
+
+rook_directions = ((1, 0), (-1, 0), (0, 1), (0, -1))
+bishop_directions = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+knight_offsets = ((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2))
+king_offsets = rook_directions + bishop_directions
+
+
+@lru_cache(maxsize=None)
+def move_tables() -> dict:
+    """
+    Lookup tables of the squares reachable from each square. Built on first use rather than at import.
+
+    'knight' and 'king' map a square to the squares one knight or king move away.
+    'rays' maps a square to a dict of direction (rook_directions or bishop_directions) to the squares
+    in that direction, nearest first.
+    """
+    def offset_squares(col, row, offsets):
+        squares = []
+        for dc, dr in offsets:
+            if 0 <= col + dc < 8 and 0 <= row + dr < 8:
+                squares.append(GameBoard.cols[col + dc] + GameBoard.rows[row + dr])
+        return tuple(squares)
+
+    tables = {'knight': {}, 'king': {}, 'rays': {}}
+    for col in range(8):
+        for row in range(8):
+            location = GameBoard.cols[col] + GameBoard.rows[row]
+            tables['knight'][location] = offset_squares(col, row, knight_offsets)
+            tables['king'][location] = offset_squares(col, row, king_offsets)
+            tables['rays'][location] = {
+                (dc, dr): offset_squares(col, row, [(dc * i, dr * i) for i in range(1, 8)])
+                for dc, dr in rook_directions + bishop_directions
+            }
+    return tables
+
+
 class GameMoves:
     """
     Class to determine which moves are allowed and to move pieces.
@@ -33,10 +84,18 @@ class GameMoves:
         # TODO: check castling
         # TODO: check for check
 
+        # remove pawn captured en-passant
+        if isinstance(piece, Pawn) and new_location == board.en_passant and board[new_location] is None \
+                and new_location[0] != old_location[0]:
+            board[new_location[0] + old_location[1]] = None
+
         # update board
+        # pieces are shared between copies of the board, so a moved piece is replaced rather than modified
+        if not piece.has_moved:
+            piece = type(piece).shared(piece.color, has_moved=True)
         board[old_location] = None
         board[new_location] = piece
-        piece.has_moved = True
+        board.version += 1
 
         # update en-passant
         new_row = int(new_location[1])
@@ -48,7 +107,7 @@ class GameMoves:
             board.en_passant = None
 
         # update board history
-        board.history.append(f'Moved {piece.color} {piece.name} from {old_location} to {new_location}.')
+        board.add_history(f'Moved {piece.color} {piece.name} from {old_location} to {new_location}.')
 
         # update turn
         board.turn = 'black' if board.turn == 'white' else 'white'
@@ -65,6 +124,8 @@ class GameMoves:
         """
         Gets the allowed moves for a piece in the specified location.
         Note that a piece cannot move to its current position.
+
+        Results are memoized in board.move_cache until the board changes.
         """
         # TODO: Check for check
         # convert to upper case if user forgot
@@ -83,9 +144,13 @@ class GameMoves:
 
         if piece is None:
             return set()
-        else:
+
+        moves = board.move_cache.get(location, board.version)
+        if moves is None:
             move_func = move_funcs[type(piece)]
-            return move_func(board, piece, location)
+            moves = move_func(board, piece, location)
+            board.move_cache.put(location, board.version, moves)
+        return set(moves)  # copy so callers cannot modify the cached set
 
     @staticmethod
     def get_all_attacks(board: GameBoard, color: Color, simple_king: bool = False) -> Locations:
@@ -100,7 +165,7 @@ class GameMoves:
                     if simple_king:
                         attacks = GameMoves._simple_king_moves(board, location)
                     else:
-                        attacks = GameMoves._king_moves(board, location)
+                        attacks = GameMoves._king_moves(board, piece, location)
                 elif isinstance(piece, Pawn):
                     attacks = GameMoves._pawn_attack_moves(board, piece, location)
                 else:
@@ -113,14 +178,103 @@ class GameMoves:
         """
         Returns all possible moves allowed by the specified color.
         """
-        all_moves = GameMoves.get_all_attacks(board, color)
+        all_moves = board.move_cache.get(color, board.version)
+        if all_moves is None:
+            all_moves = GameMoves.get_all_attacks(board, color)
+
+            # Add pawn moves that are not attacks
+            for location, piece in board.items():
+                if piece and piece.color == color:
+                    if isinstance(piece, Pawn):
+                        all_moves.update(GameMoves._pawn_moves(board, piece, location))
+            board.move_cache.put(color, board.version, all_moves)
+        return set(all_moves)  # copy so callers cannot modify the cached set
 
-        # Add pawn moves that are not attacks
-        for location, piece in board.items():
-            if piece and piece.color == color:
-                if isinstance(piece, Pawn):
-                    all_moves.update(GameMoves._pawn_attack_moves(board, piece, location))
-        return all_moves
+    @staticmethod
+    def iter_moves(board: GameBoard, color: Color) -> Iterator[Move]:
+        """
+        Lazily yields the moves allowed by the specified color.
+
+        Moves are generated in stages, one piece at a time:
+        captures first (found without generating quiet moves), then quiet moves.
+        Consumers that stop early (e.g. after the first move) skip generating moves for the remaining pieces.
+        """
+        pieces = [(location, piece) for location, piece in board.items() if piece is not None and piece.color == color]
+
+        for location, piece in pieces:
+            for new_location in GameMoves._capture_moves(board, piece, location):
+                move = GameMoves._create_move(board, piece, location, new_location)
+                if move.capture is not None:
+                    yield move
+
+        for location, piece in pieces:
+            for new_location in GameMoves.get_moves(board, location):
+                move = GameMoves._create_move(board, piece, location, new_location)
+                if move.capture is None:
+                    yield move
+
+    @staticmethod
+    def has_moves(board: GameBoard, color: Color) -> bool:
+        """
+        Check if the specified color has any move. Stops at the first piece that can move.
+        """
+        for location, piece in list(board.items()):
+            if piece and piece.color == color and GameMoves.get_moves(board, location):
+                return True
+        return False
+
+    @staticmethod
+    def _capture_moves(board: GameBoard, piece: GamePiece, location: Location) -> Locations:
+        """
+        Moves of the piece onto enemy pieces (and en-passant squares for pawns).
+
+        Cheaper than get_moves because quiet moves are not generated.
+        The king's moves are only generated when an enemy piece is next to it.
+        """
+        tables = move_tables()
+
+        def is_enemy(new_location):
+            target = board[new_location]
+            return target is not None and target.color != piece.color
+
+        if isinstance(piece, Pawn):
+            return GameMoves._pawn_attack_moves(board, piece, location)
+        if isinstance(piece, King):
+            if not any(is_enemy(new_location) for new_location in tables['king'][location]):
+                return set()
+            return {new_location for new_location in GameMoves.get_moves(board, location) if is_enemy(new_location)}
+        if isinstance(piece, Knight):
+            return {new_location for new_location in tables['knight'][location] if is_enemy(new_location)}
+
+        directions = ()
+        if isinstance(piece, (Rook, Queen)):
+            directions += rook_directions
+        if isinstance(piece, (Bishop, Queen)):
+            directions += bishop_directions
+        moves = set()
+        rays = tables['rays'][location]
+        for direction in directions:
+            for new_location in rays[direction]:  # only the first piece in each direction can be captured
+                if board[new_location] is not None:
+                    if is_enemy(new_location):
+                        moves.add(new_location)
+                    break
+        return moves
+
+    @staticmethod
+    def _create_move(board: GameBoard, piece: GamePiece, location: Location, new_location: Location) -> Move:
+        """
+        Describe the move of piece from location to new_location.
+        """
+        capture = board[new_location]
+        flags = ()
+        if isinstance(piece, Pawn):
+            if capture is None and new_location == board.en_passant and new_location[0] != location[0]:
+                capture = board[new_location[0] + location[1]]  # captured pawn is beside the attacking pawn
+                flags = ('en_passant',)
+            elif abs(int(new_location[1]) - int(location[1])) == 2:
+                flags = ('double_push',)
+        return Move(location, new_location, piece, capture, flags)
 
     @staticmethod
     def _simple_king_moves(board: GameBoard, location: Location) -> Locations:
@@ -130,40 +284,17 @@ class GameMoves:
         Note: Designed to avoid infinite recursion when friendly king checks possible moves of enemy king
         (which in turn would check possible moves of the friendly king).
         """
-        # king's current location
-        col = ord(location[0])
-        row = int(location[1])
-
-        # all locations within 1 move
-        col_range = range(col - 1, col + 2)
-        row_range = range(row - 1, row + 2)
-        locations_to_check = [chr(c) + str(r) for r in row_range for c in col_range]
-
         # Simplified estimate of enemy king moves
         # TODO: Improve so it correctly shows spots that are blocked by friendly pieces or enemy king's range
-        moves = set()
-        for new_location in locations_to_check:
-            try:
-                board[new_location]
-            except KeyError:  # new_location is out of range of the board
-                continue
-            else:
-                moves.add(new_location)
-        return moves
+        return set(move_tables()['king'][location])
 
     @staticmethod
     def _king_moves(board: GameBoard, piece: GamePiece, location: Location) -> Locations:
         """
         Moves allowed by the king
         """
-        # king's current location
-        col = ord(location[0])
-        row = int(location[1])
-
         # all locations within 1 move
-        col_range = range(col - 1, col + 2)
-        row_range = range(row - 1, row + 2)
-        locations_to_check = [chr(c) + str(r) for r in row_range for c in col_range]
+        locations_to_check = move_tables()['king'][location]
 
         # determine all places the enemy can attack
         enemy_color = 'black' if piece.color == 'white' else 'white'
@@ -172,11 +303,6 @@ class GameMoves:
         # determine the valid moves
         moves = set()
         for new_location in locations_to_check:
-            try:
-                board[new_location]
-            except KeyError:  # new_location is out of range of the board
-                continue
-
             if new_location not in all_enemy_attacks:
                 # new_location must not be attackable by enemy
                 if board[new_location] is None or board[new_location].color != piece.color:
@@ -198,6 +324,7 @@ class GameMoves:
 
         # TODO: Check for castling
         # TODO: determine if king is in check
+        left_rook = right_rook = None
         if not piece.has_moved:
             left_rook = board['A' + str(row)]
             right_rook = board['H' + str(row)]
@@ -226,24 +353,14 @@ class GameMoves:
         """
         Moves allowed by a rook
         """
-        # rook's current location
-        col = ord(location[0])
-        row = int(location[1])
-
         # possible moves
         moves = set()
-        directions_to_check = {
-            'right': lambda x: '%c%s' % (col + x, row),
-            'left': lambda x: '%c%s' % (col - x, row),
-            'up': lambda x: '%c%s' % (col, row + x),
-            'down': lambda x: '%c%s' % (col, row - x),
-        }
-        for direction, move_rook in directions_to_check.items():
-            for i in range(1, 8):  # a rook can move between 1 and 7 spaces at most
-                new_location = move_rook(i)
-                if new_location in board.keys() and board[new_location] is None:
+        rays = move_tables()['rays'][location]
+        for direction in rook_directions:
+            for new_location in rays[direction]:  # squares in this direction, nearest first
+                if board[new_location] is None:
                     moves.add(new_location)
-                elif new_location in board.keys() and board[new_location].color != piece.color:
+                elif board[new_location].color != piece.color:
                     moves.add(new_location)
                     break
                 else:
@@ -256,24 +373,14 @@ class GameMoves:
         """
         Moves allowed by a bishop
         """
-        # bishop's current location
-        col = ord(location[0])
-        row = int(location[1])
-
         # possible moves
         moves = set()
-        directions_to_check = {
-            'upper-right': lambda x: '%c%s' % (col + x, row + x),
-            'lower-right': lambda x: '%c%s' % (col + x, row - x),
-            'lower-left': lambda x: '%c%s' % (col - x, row - x),
-            'upper-left': lambda x: '%c%s' % (col - x, row + x),
-        }
-        for direction, move_bishop in directions_to_check.items():
-            for i in range(1, 8):  # a bishop can move between 1 and 7 spaces at most
-                new_location = move_bishop(i)
-                if new_location in board.keys() and board[new_location] is None:
+        rays = move_tables()['rays'][location]
+        for direction in bishop_directions:
+            for new_location in rays[direction]:  # squares in this direction, nearest first
+                if board[new_location] is None:
                     moves.add(new_location)
-                elif new_location in board.keys() and board[new_location].color != piece.color:
+                elif board[new_location].color != piece.color:
                     moves.add(new_location)
                     break
                 else:
@@ -286,28 +393,11 @@ class GameMoves:
         """
         Moves allowed by a knight.
         """
-        # knight's current location
-        col = ord(location[0])
-        row = int(location[1])
-
-        # possible moves
-        moves = {
-            '%c%s' % (col - 1, row + 2),  # upper left
-            '%c%s' % (col + 1, row + 2),  # upper right
-            '%c%s' % (col + 2, row + 1),  # right upper
-            '%c%s' % (col + 2, row - 1),  # right lower
-            '%c%s' % (col + 1, row - 2),  # lower right
-            '%c%s' % (col - 1, row - 2),  # lower left
-            '%c%s' % (col - 2, row - 1),  # left lower
-            '%c%s' % (col - 2, row + 1),  # left upper
-        }  # type: Locations
-
-        # verify possible move is on the board and not occupied by friendly piece
-        for location in moves.copy():
-            if location not in board.keys():
-                moves.remove(location)
-            elif board[location] is not None and board[location].color == piece.color:
-                moves.remove(location)
+        # possible moves not occupied by friendly piece
+        moves = set()
+        for new_location in move_tables()['knight'][location]:
+            if board[new_location] is None or board[new_location].color != piece.color:
+                moves.add(new_location)
 
         return moves
 
@@ -328,13 +418,13 @@ class GameMoves:
 
         # check moving forward 1 space
         new_location = col + str(int(row) + direction)
-        if board[new_location] is None:
+        if new_location in board.keys() and board[new_location] is None:
             moves.add(new_location)
 
             # check moving forward 2 spaces
             if not piece.has_moved:
                 new_location = col + str(int(row) + 2 * direction)
-                if board[new_location] is None:
+                if new_location in board.keys() and board[new_location] is None:
                     moves.add(new_location)
 
         # check attacks
@@ -3,6 +3,8 @@ class GamePiece:
     Game piece class.
 
     Base class for all chess pieces.
+
+    Pieces are immutable once created, which lets copies of a board share them.
     """
     names = (
         'king',
@@ -18,13 +20,43 @@ class GamePiece:
         'white',
     )
 
-    def __init__(self, name, color, has_moved=False):
-        self._name = None
-        self._color = None
+    __slots__ = ('_name', '_color', 'has_moved')
+
+    _shared = {}  # (piece type, color, has_moved): instance returned by shared()
 
-        self.name = name
-        self.color = color
-        self.has_moved = has_moved
+    def __init__(self, name, color, has_moved=False):
+        if name not in self.names:
+            raise ValueError('Invalid game piece name: \'%s\'' % name)
+        if color not in self.colors:
+            raise ValueError('Game piece color must be black or white not \'%s\'' % color)
+
+        # __setattr__ refuses all changes, set the slots directly
+        object.__setattr__(self, '_name', name)
+        object.__setattr__(self, '_color', color)
+        object.__setattr__(self, 'has_moved', has_moved)
+
+    @classmethod
+    def shared(cls, color, has_moved=False):
+        """
+        Shared instance of the piece.
+
+        Boards are filled with these instead of new pieces, so there is a single piece per type, color and has_moved.
+        """
+        key = (cls, color, has_moved)
+        try:
+            return GamePiece._shared[key]
+        except KeyError:
+            piece = GamePiece._shared[key] = cls(color, has_moved=has_moved)
+            return piece
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f'{type(self).__name__} objects cannot be modified')
+
+    def __delattr__(self, key):
+        raise AttributeError(f'{type(self).__name__} objects cannot be modified')
+
+    def __reduce__(self):
+        return type(self).shared, (self.color, self.has_moved)
 
     def __repr__(self):
         if self.has_moved:
@@ -37,54 +69,54 @@ class GamePiece:
     def name(self):
         return self._name
 
-    @name.setter
-    def name(self, val):
-        if val not in self.names:
-            raise ValueError('Invalid game piece name: \'%s\'' % val)
-        self._name = val
-
     @property
     def color(self):
         return self._color
 
-    @color.setter
-    def color(self, val):
-        if val not in self.colors:
-            raise ValueError('Game piece color must be black or white not \'%s\'' % val)
-        self._color = val
-
 
 class King(GamePiece):
+    __slots__ = ()
+    character = 'K'
+
     def __init__(self, *args, **kwargs):
-        self.character = 'K'
         super().__init__('king', *args, **kwargs)
 
 
 class Queen(GamePiece):
+    __slots__ = ()
+    character = 'Q'
+
     def __init__(self, *args, **kwargs):
-        self.character = 'Q'
         super().__init__('queen', *args, **kwargs)
 
 
 class Rook(GamePiece):
+    __slots__ = ()
+    character = 'R'
+
     def __init__(self, *args, **kwargs):
-        self.character = 'R'
         super().__init__('rook', *args, **kwargs)
 
 
 class Bishop(GamePiece):
+    __slots__ = ()
+    character = 'B'
+
     def __init__(self, *args, **kwargs):
-        self.character = 'B'
         super().__init__('bishop', *args, **kwargs)
 
 
 class Knight(GamePiece):
+    __slots__ = ()
+    character = 'N'
+
     def __init__(self, *args, **kwargs):
-        self.character = 'N'
         super().__init__('knight', *args, **kwargs)
 
 
 class Pawn(GamePiece):
+    __slots__ = ()
+    character = 'P'
+
     def __init__(self, *args, **kwargs):
-        self.character = 'P'
         super().__init__('pawn', *args, **kwargs)
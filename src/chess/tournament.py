@@ -0,0 +1,266 @@
+"""
+Engine vs engine tournaments played over a pool of worker processes.
+
+Run with: python -m chess.tournament --help
+"""
+import argparse
+import math
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .board import GameBoard
+from .engine import has_king, search
+from .moves import GameMoves
+
+Opening = Sequence[str]  # moves in UCI notation, e.g. ('e2e4', 'e7e5')
+
+
+class GameResult(NamedTuple):
+    """
+    Finished tournament game
+    """
+    round: int
+    white: str
+    black: str
+    result: str  # '1-0', '0-1' or '1/2-1/2'
+    moves: Tuple[str, ...]
+
+
+def load_openings(path: str) -> List[Opening]:
+    """
+    Read an opening suite: one opening per line, moves in UCI notation separated by spaces.
+
+    Blank lines and lines starting with '#' are skipped.
+
+    :raises ValueError: if an opening cannot be played
+    """
+    openings = []
+    with open(path) as fo:
+        for number, line in enumerate(fo, start=1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            opening = tuple(line.split())
+            board = GameBoard()
+            try:
+                for move in opening:
+                    if len(move) != 4:
+                        raise ValueError(f'invalid move notation \'{move}\'')
+                    GameMoves.move(board, move[0:2], move[2:4])
+            except (KeyError, ValueError) as e:
+                raise ValueError(f'{path}:{number}: cannot play opening: {e}') from None
+            openings.append(opening)
+    return openings
+
+
+def play_game(white_depth: int, black_depth: int, opening: Opening = (), max_plies: int = 200,
+              seed: Optional[int] = None) -> Tuple[str, List[str]]:
+    """
+    Play a game between two engines searching to the specified depths.
+
+    Games are lost by having the king captured and drawn when the side to move has no moves
+    or after max_plies plies.
+
+    :param seed: seed for breaking ties between equally scored moves. Without a seed the engines are deterministic
+        and every game from the same opening is identical.
+    :return: result ('1-0', '0-1' or '1/2-1/2') and the moves played in UCI notation
+    """
+    board = GameBoard()
+    moves = []
+    for move in opening:
+        GameMoves.move(board, move[0:2], move[2:4])
+        moves.append(move)
+
+    rng = random.Random(seed) if seed is not None else None
+    depths = {'white': white_depth, 'black': black_depth}
+    while len(moves) < max_plies:
+        if not has_king(board, board.turn):
+            return ('0-1' if board.turn == 'white' else '1-0'), moves
+        _, move = search(board, depths[board.turn], rng=rng)
+        if move is None:
+            return '1/2-1/2', moves
+        GameMoves.move(board, move.from_location, move.to_location)
+        moves.append((move.from_location + move.to_location).lower())
+    return '1/2-1/2', moves
+
+
+def _play_round(round_number: int, white: str, black: str, white_depth: int, black_depth: int, opening: Opening,
+                max_plies: int, seed: int) -> GameResult:
+    result, moves = play_game(white_depth, black_depth, opening, max_plies, seed)
+    return GameResult(round_number, white, black, result, tuple(moves))
+
+
+def run_tournament(depth_a: int, depth_b: int, games: int, openings: Sequence[Opening], workers: Optional[int] = None,
+                   max_plies: int = 200, seed: int = 0, callback=None) -> List[GameResult]:
+    """
+    Play engine A against engine B.
+
+    Each opening is played twice with the colors reversed. Every game gets its own seed for breaking ties between
+    equally scored moves, so openings can be replayed without repeating games.
+
+    :param games: number of games to play
+    :param openings: opening suite, see load_openings
+    :param workers: number of worker processes (defaults to the number of CPUs)
+    :param seed: seed the per game seeds are drawn from, the same seed replays the same tournament
+    :param callback: optional function called with each GameResult as soon as it finishes
+    :return: results ordered by round
+    """
+    if not openings:
+        raise ValueError('The opening suite is empty')
+
+    rng = random.Random(seed)
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for i in range(games):
+            opening = openings[(i // 2) % len(openings)]
+            if i % 2 == 0:
+                args = ('A', 'B', depth_a, depth_b)
+            else:
+                args = ('B', 'A', depth_b, depth_a)
+            futures.append(executor.submit(_play_round, i + 1, *args, opening, max_plies, rng.getrandbits(64)))
+
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if callback is not None:
+                callback(result)
+    return sorted(results)
+
+
+def score(results: Iterable[GameResult], engine: str = 'A') -> Tuple[int, int, int]:
+    """
+    Wins, draws and losses of the engine
+    """
+    wins = draws = losses = 0
+    for game in results:
+        if game.result == '1/2-1/2':
+            draws += 1
+        elif (game.result == '1-0') == (game.white == engine):
+            wins += 1
+        else:
+            losses += 1
+    return wins, draws, losses
+
+
+def elo_difference(wins: int, draws: int, losses: int) -> float:
+    """
+    Elo difference implied by the score (infinite if all games were won or lost)
+    """
+    games = wins + draws + losses
+    if games == 0:
+        return 0.0
+    points = (wins + draws / 2) / games
+    if points <= 0:
+        return -math.inf
+    if points >= 1:
+        return math.inf
+    return -400 * math.log10(1 / points - 1)
+
+
+def sprt(wins: int, draws: int, losses: int, elo0: float = 0, elo1: float = 5, alpha: float = 0.05,
+         beta: float = 0.05) -> Tuple[float, float, float]:
+    """
+    Sequential probability ratio test of H0: elo = elo0 against H1: elo = elo1.
+
+    Uses the normal approximation of the log-likelihood ratio of the trinomial (win/draw/loss) model.
+
+    :return: log-likelihood ratio with its lower and upper bounds.
+        H1 is accepted once the ratio exceeds the upper bound and H0 once it falls below the lower bound.
+    """
+    lower = math.log(beta / (1 - alpha))
+    upper = math.log((1 - beta) / alpha)
+
+    games = wins + draws + losses
+    if games == 0 or wins == games or losses == games:
+        return 0.0, lower, upper
+
+    mean = (wins + draws / 2) / games
+    variance = (wins * (1 - mean) ** 2 + draws * (0.5 - mean) ** 2 + losses * mean ** 2) / games
+    if variance == 0:
+        return 0.0, lower, upper
+
+    score0 = 1 / (1 + 10 ** (-elo0 / 400))
+    score1 = 1 / (1 + 10 ** (-elo1 / 400))
+    llr = games * (score1 - score0) * (2 * mean - score0 - score1) / (2 * variance)
+    return llr, lower, upper
+
+
+def to_pgn(game: GameResult, event: str = 'Engine match') -> str:
+    """
+    PGN record of the game.
+
+    Moves are written in long algebraic (UCI) notation since the package has no SAN writer.
+    """
+    headers = [
+        ('Event', event),
+        ('Site', '?'),
+        ('Date', date.today().strftime('%Y.%m.%d')),
+        ('Round', str(game.round)),
+        ('White', game.white),
+        ('Black', game.black),
+        ('Result', game.result),
+    ]
+    lines = [f'[{key} "{value}"]' for key, value in headers]
+
+    movetext = []
+    for ply, move in enumerate(game.moves):
+        if ply % 2 == 0:
+            movetext.append(f'{ply // 2 + 1}.')
+        movetext.append(move)
+    movetext.append(game.result)
+    return '\n'.join(lines) + '\n\n' + ' '.join(movetext) + '\n'
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Play engine A against engine B')
+    parser.add_argument('--openings', required=True, metavar='FILE',
+                        help='opening suite, one opening per line in UCI notation (e.g. "e2e4 e7e5")')
+    parser.add_argument('--games', type=int, default=16, help='number of games')
+    parser.add_argument('--depth-a', type=int, default=2, help='search depth of engine A')
+    parser.add_argument('--depth-b', type=int, default=1, help='search depth of engine B')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: all CPUs)')
+    parser.add_argument('--max-plies', type=int, default=200, help='plies before a game is drawn')
+    parser.add_argument('--seed', type=int, default=0, help='seed for breaking ties between equally scored moves')
+    parser.add_argument('--pgn', default=None, help='file to write the games to')
+    parser.add_argument('--elo0', type=float, default=0, help='SPRT null hypothesis')
+    parser.add_argument('--elo1', type=float, default=5, help='SPRT alternative hypothesis')
+    args = parser.parse_args()
+
+    try:
+        openings = load_openings(args.openings)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    if not openings:
+        parser.error(f'no openings in {args.openings}')
+
+    start = time.perf_counter()
+    finished = []
+
+    def report(game):
+        finished.append(game)
+        wins, draws, losses = score(finished)
+        rate = len(finished) / (time.perf_counter() - start) * 60
+        print(f'Game {len(finished)}/{args.games}: +{wins} ={draws} -{losses} ({rate:.1f} games/min)')
+
+    results = run_tournament(args.depth_a, args.depth_b, args.games, openings, workers=args.workers,
+                             max_plies=args.max_plies, seed=args.seed, callback=report)
+
+    if args.pgn:
+        with open(args.pgn, 'w') as fo:
+            fo.write('\n'.join(to_pgn(game) for game in results))
+
+    wins, draws, losses = score(results)
+    llr, lower, upper = sprt(wins, draws, losses, args.elo0, args.elo1)
+    print(f'Score of A vs B: {wins} - {losses} - {draws}')
+    print(f'Elo difference: {elo_difference(wins, draws, losses):.1f}')
+    print(f'SPRT: llr {llr:.2f} ({lower:.2f}, {upper:.2f}) [{args.elo0:g}, {args.elo1:g}]')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
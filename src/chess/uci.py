@@ -0,0 +1,276 @@
+"""
+UCI (Universal Chess Interface) front-end.
+
+Run with: python -m chess.uci
+"""
+import sys
+import threading
+from typing import List
+
+from .board import GameBoard
+from .engine import MATE_SCORE, iterative_deepening
+from .moves import GameMoves, Move
+from .pieces import Queen, Rook, Bishop, Knight, Pawn
+
+ENGINE_NAME = 'chess'
+ENGINE_AUTHOR = 'Joe Corvino'
+
+DEFAULT_DEPTH = 3  # used by "go" without any limits
+MAX_DEPTH = 64  # used by "go infinite" and "go ponder"
+
+promotion_pieces = {'q': Queen, 'r': Rook, 'b': Bishop, 'n': Knight}
+
+
+def format_move(move: Move) -> str:
+    """
+    UCI notation of a move, e.g. 'e2e4'
+    """
+    return (move.from_location + move.to_location).lower()
+
+
+def format_score(score: int, line: List[Move]) -> str:
+    """
+    UCI notation of a search score, e.g. 'cp 25' or 'mate 2' (negative when the engine is getting mated)
+    """
+    if abs(score) != MATE_SCORE:
+        return f'cp {score}'
+    # games end with the king being captured, count the moves until then
+    if score > 0:
+        return f'mate {(len(line) + 1) // 2}'
+    return f'mate -{len(line) // 2}'
+
+
+class UCIEngine:
+    """
+    Maps UCI commands onto GameBoard and GameMoves.
+
+    Searches run on a background thread so "stop" and "isready" are answered immediately.
+    """
+    def __init__(self, output=None):
+        """
+        :param output: file-like object to write responses to (defaults to sys.stdout)
+        """
+        self.output = output
+        self.board = GameBoard()  # None when the GUI's position could not be reproduced
+        self._output_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._timer = None
+        self._worker = None
+        self._pondering = False
+        self._movetime = None  # seconds allowed for the search once pondering ends
+        self._ponderhit_depth = None  # depth allowed for the search once pondering ends without a time limit
+        self._completed_depth = 0
+
+    def send(self, message: str) -> None:
+        """
+        Write a response line
+        """
+        with self._output_lock:
+            output = self.output or sys.stdout
+            output.write(message + '\n')
+            output.flush()
+
+    def run(self, lines=None) -> None:
+        """
+        Read commands until "quit" or end of input.
+
+        :param lines: iterable of command lines (defaults to sys.stdin)
+        """
+        for line in lines if lines is not None else sys.stdin:
+            if not self.handle(line):
+                break
+        self.stop()
+
+    def handle(self, line: str) -> bool:
+        """
+        Handle a single command.
+
+        :return: False when the engine should quit
+        """
+        tokens = line.split()
+        if not tokens:
+            return True
+        command, args = tokens[0], tokens[1:]
+
+        if command == 'uci':
+            self.send(f'id name {ENGINE_NAME}')
+            self.send(f'id author {ENGINE_AUTHOR}')
+            self.send('option name Ponder type check default true')
+            self.send('uciok')
+        elif command == 'isready':
+            self.send('readyok')
+        elif command == 'ucinewgame':
+            self.stop()
+            self.board = GameBoard()
+        elif command == 'position':
+            self.stop()
+            self.position(args)
+        elif command == 'go':
+            self.stop()
+            self.go(args)
+        elif command == 'stop':
+            self.stop()
+        elif command == 'ponderhit':
+            self.ponderhit()
+        elif command == 'quit':
+            return False
+        # unknown commands are ignored as required by the protocol
+        return True
+
+    def position(self, args: List[str]) -> None:
+        """
+        Handle "position startpos [moves ...]"
+
+        If the position cannot be reproduced (FEN positions, castling, illegal moves) the board is marked invalid
+        and "go" answers with a null move rather than searching a position the GUI does not have.
+        """
+        self.board = None
+        if not args or args[0] != 'startpos':
+            self.send('info string only "position startpos" is supported')
+            return
+
+        board = GameBoard()
+        moves = args[2:] if len(args) > 1 and args[1] == 'moves' else []
+        for move in moves:
+            try:
+                self._apply_move(board, move)
+            except (KeyError, ValueError) as e:
+                self.send(f'info string cannot play move {move}: {e}')
+                return
+        self.board = board
+
+    @staticmethod
+    def _apply_move(board: GameBoard, move: str) -> None:
+        """
+        Play a move in UCI notation (e.g. 'e2e4' or 'e7e8q') on the board
+        """
+        if len(move) not in (4, 5):
+            raise ValueError('invalid move notation')
+        GameMoves.move(board, move[0:2], move[2:4])
+        if len(move) == 5:
+            location = move[2:4].upper()
+            piece = board[location]
+            last_row = '8' if piece.color == 'white' else '1'
+            if not isinstance(piece, Pawn) or location[1] != last_row or move[4] not in promotion_pieces:
+                raise ValueError('invalid promotion')
+            board[location] = promotion_pieces[move[4]].shared(piece.color, has_moved=True)
+
+    def go(self, args: List[str]) -> None:
+        """
+        Handle "go" and start searching on a background thread
+        """
+        options = {}
+        flags = set()
+        i = 0
+        while i < len(args):
+            if args[i] in ('infinite', 'ponder'):
+                flags.add(args[i])
+                i += 1
+            else:
+                if i + 1 < len(args):
+                    options[args[i]] = args[i + 1]
+                i += 2
+
+        # ignore options with values that are not numbers
+        for key, value in list(options.items()):
+            try:
+                options[key] = int(value)
+            except ValueError:
+                self.send(f'info string ignoring go {key} {value}')
+                del options[key]
+
+        if self.board is None:
+            self.send('info string no valid position')
+            self.send('bestmove 0000')
+            return
+
+        max_depth = max(options['depth'], 1) if 'depth' in options else None
+        movetime = None
+        if 'movetime' in options:
+            movetime = options['movetime'] / 1000
+        elif 'wtime' in options or 'btime' in options:
+            remaining = options.get('wtime' if self.board.turn == 'white' else 'btime', 0)
+            increment = options.get('winc' if self.board.turn == 'white' else 'binc', 0)
+            movestogo = options.get('movestogo', 30)
+            movetime = (remaining / max(movestogo, 1) + increment) / 1000
+
+        infinite = 'infinite' in flags
+        self._pondering = 'ponder' in flags
+        self._movetime = movetime
+        self._ponderhit_depth = DEFAULT_DEPTH if self._pondering and max_depth is None and movetime is None else None
+        self._completed_depth = 0
+        if max_depth is None:
+            max_depth = MAX_DEPTH if infinite or self._pondering or movetime else DEFAULT_DEPTH
+
+        self._stop.clear()
+        if movetime is not None and not self._pondering:
+            self._start_timer(movetime)
+        board = self.board
+        self._worker = threading.Thread(target=self._search, args=(board, max_depth, infinite), daemon=True)
+        self._worker.start()
+
+    def _start_timer(self, seconds: float) -> None:
+        self._timer = threading.Timer(seconds, self._stop.set)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _search(self, board: GameBoard, max_depth: int, infinite: bool) -> None:
+        """
+        Background search. Reports each completed depth and finally the best move.
+        """
+        line = []  # type: List[Move]
+        for depth, score, line in iterative_deepening(board, max_depth, self._stop):
+            pv = ' '.join(format_move(move) for move in line)
+            self.send(f'info depth {depth} score {format_score(score, line)} pv {pv}')
+            self._completed_depth = depth
+            if not self._pondering and self._ponderhit_depth is not None and depth >= self._ponderhit_depth:
+                break
+
+        # The protocol does not allow bestmove before "stop" while searching infinitely or pondering
+        while (infinite or self._pondering) and not self._stop.is_set():
+            self._stop.wait(0.01)
+
+        if not line:
+            # no completed depth: fall back on any legal move
+            move = next(GameMoves.iter_moves(board, board.turn), None)
+            line = [move] if move else []
+        if not line:
+            self.send('bestmove 0000')
+        elif len(line) > 1:
+            self.send(f'bestmove {format_move(line[0])} ponder {format_move(line[1])}')
+        else:
+            self.send(f'bestmove {format_move(line[0])}')
+
+    def ponderhit(self) -> None:
+        """
+        The opponent played the expected move: keep searching but under normal time control
+        """
+        if not self._pondering:
+            return
+        self._pondering = False
+        if self._movetime is not None:
+            self._start_timer(self._movetime)
+        elif self._ponderhit_depth is not None and self._completed_depth >= self._ponderhit_depth:
+            # without a time limit the search would go on to MAX_DEPTH, stop at the depth a plain "go" uses
+            self._stop.set()
+
+    def stop(self) -> None:
+        """
+        Stop the running search (if any) and wait for it to report its best move
+        """
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+
+def main() -> int:
+    UCIEngine().run()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,46 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+from benchmarks import bench
+
+
+def results(**times):
+    return {'benchmarks': {name: {'best_us': best, 'mean_us': best, 'calls': 1} for name, best in times.items()}}
+
+
+class TestBench(unittest.TestCase):
+    """
+    Test benchmark baseline comparison
+    """
+    def test_compare(self):
+        baseline = results(board_init=10.0, move=20.0)
+        self.assertListEqual(bench.compare(results(board_init=11.9, move=20.0), baseline, 0.2), [])
+        self.assertListEqual(bench.compare(results(board_init=12.1, move=20.0), baseline, 0.2), ['board_init'])
+        self.assertListEqual(bench.compare(results(board_init=12.1, move=30.1), baseline, 0.5), ['move'])
+
+        # benchmarks missing from the baseline are not compared
+        self.assertListEqual(bench.compare(results(board_copy=100.0), baseline, 0.2), [])
+
+    def test_main_exit_status(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            with open(path, 'w') as fo:
+                json.dump(results(noop=1.0), fo)
+
+            def run(best_us):
+                timing = {'best_us': best_us, 'mean_us': best_us, 'calls': 1}
+                with mock.patch.object(bench, 'benchmarks', return_value={'noop': lambda: None}), \
+                        mock.patch.object(bench, 'imports', {}), \
+                        mock.patch.object(bench, 'measure', return_value=timing), \
+                        redirect_stdout(io.StringIO()) as output:
+                    status = bench.main(['--baseline', path, '--tolerance', '0.2'])
+                return status, output.getvalue()
+
+            self.assertEqual(run(1.1)[0], 0)
+            status, output = run(1.5)
+            self.assertEqual(status, 1)
+            self.assertIn('REGRESSION noop', output)
@@ -1,5 +1,7 @@
+import mmap
+import pickle
 import unittest
-from src.chess.board import GameBoard
+from src.chess.board import GameBoard, MoveCache, PackedPositions, PACKED_SIZE
 from src.chess.pieces import King, Queen, Rook, Bishop, Knight, Pawn, GamePiece
 
 
@@ -87,3 +89,133 @@ class TestGameBoard(unittest.TestCase):
         self.assertIsInstance(gb['E1'], King)
         self.assertIsInstance(gb['E8'], King)
 
+    def test_version(self):
+        # Test GameBoard.version is bumped on changes
+        gb = GameBoard()
+        version = gb.version
+        gb['A3'] = gb['A2']
+        self.assertGreater(gb.version, version)
+
+        version = gb.version
+        gb.en_passant = 'A3'
+        self.assertGreater(gb.version, version)
+
+    def test_pickle(self):
+        gb = GameBoard(turn='black')
+        gb2 = pickle.loads(pickle.dumps(gb))
+        self.assertEqual(gb2.turn, 'black')
+        self.assertIsInstance(gb2['E1'], King)
+
+    def test_copy(self):
+        gb = GameBoard(history=['Moved white pawn from E2 to E4.'])
+        gb2 = gb.copy()
+        self.assertIsInstance(gb2, GameBoard)
+        self.assertIs(gb2['E1'], gb['E1'])  # pieces are shared
+        self.assertIs(gb2._history_node, gb._history_node)  # history is shared
+
+        gb2['E1'] = None
+        self.assertIsInstance(gb['E1'], King)
+
+        gb2.add_history('Moved black pawn from E7 to E5.')
+        self.assertEqual(len(gb2.history), 2)
+        self.assertListEqual(gb.history, ['Moved white pawn from E2 to E4.'])
+
+        gb.history.append('Moved white pawn from D2 to D4.')  # list changes only affect their own board
+        self.assertListEqual(gb.history, ['Moved white pawn from E2 to E4.', 'Moved white pawn from D2 to D4.'])
+        self.assertEqual(gb2.history[-1], 'Moved black pawn from E7 to E5.')
+        gb2.history.pop()
+        self.assertListEqual(gb2.history, ['Moved white pawn from E2 to E4.'])
+        self.assertEqual(len(gb.history), 2)
+
+    def test_pickle_long_history(self):
+        gb = GameBoard()
+        for i in range(5000):
+            gb.add_history(f'entry {i}')
+        gb2 = pickle.loads(pickle.dumps(gb))
+        self.assertEqual(len(gb2.history), 5000)
+        self.assertEqual(gb2.history[-1], 'entry 4999')
+
+
+class TestMoveCache(unittest.TestCase):
+    """
+    Test MoveCache class
+    """
+    def test_get_put(self):
+        cache = MoveCache(maxsize=2)
+        self.assertIsNone(cache.get('A2', 0))
+        cache.put('A2', 0, {'A3'})
+        self.assertSetEqual(cache.get('A2', 0), {'A3'})
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hit_rate, 0.5)
+
+        # newer version invalidates all entries
+        self.assertIsNone(cache.get('A2', 1))
+        self.assertEqual(len(cache), 0)
+
+    def test_maxsize(self):
+        cache = MoveCache(maxsize=2)
+        cache.put('A2', 0, {'A3'})
+        cache.put('B2', 0, {'B3'})
+        cache.get('A2', 0)
+        cache.put('C2', 0, {'C3'})  # evicts least recently used entry
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('B2', 0))
+        self.assertIsNotNone(cache.get('A2', 0))
+
+
+class TestPackedPositions(unittest.TestCase):
+    """
+    Test packed board format
+    """
+    def assertBoardsEqual(self, gb1, gb2):
+        for location in gb1.keys():
+            piece1, piece2 = gb1[location], gb2[location]
+            self.assertIs(type(piece1), type(piece2))
+            if piece1 is not None:
+                self.assertEqual(piece1.color, piece2.color)
+                self.assertEqual(piece1.has_moved, piece2.has_moved)
+        self.assertEqual(gb1.turn, gb2.turn)
+        self.assertEqual(gb1.en_passant, gb2.en_passant)
+
+    def test_to_bytes(self):
+        gb = GameBoard(turn='black', en_passant='E3')
+        gb['E4'], gb['E2'] = Pawn('white', has_moved=True), None
+        data = gb.to_bytes()
+        self.assertEqual(len(data), PACKED_SIZE)
+        self.assertBoardsEqual(GameBoard.from_bytes(memoryview(data)), gb)
+
+    def test_packed_positions(self):
+        positions = PackedPositions.create(2)
+        self.assertEqual(len(positions), 2)
+        gb = GameBoard()
+        gb['D1'] = None
+        positions[1] = gb
+        self.assertBoardsEqual(positions[-1], gb)
+        self.assertIsNone(positions[0]['A1'])  # empty slot unpacks to an empty board
+        self.assertRaises(IndexError, positions.__getitem__, 2)
+
+    def test_packed_positions_mmap(self):
+        # boards are packed into and read from a memory-mapped buffer in place
+        buffer = mmap.mmap(-1, 3 * PACKED_SIZE)
+        try:
+            positions = PackedPositions(buffer)
+            gb = GameBoard(turn='black')
+            gb['E2'] = None
+            positions[2] = gb
+            self.assertEqual(buffer[2 * PACKED_SIZE:3 * PACKED_SIZE], gb.to_bytes())
+            self.assertBoardsEqual(positions[2], gb)
+            with memoryview(buffer) as view:
+                self.assertBoardsEqual(GameBoard.from_bytes(view, 2 * PACKED_SIZE), gb)
+        finally:
+            buffer.close()
+
+    def test_from_bytes_invalid(self):
+        for code in (7, 8, 15):
+            data = bytearray(GameBoard().to_bytes())
+            data[0] = code << 4  # piece on A1
+            self.assertRaises(ValueError, GameBoard.from_bytes, data)
+
+        data = bytearray(GameBoard().to_bytes())
+        data[-1] = 64  # en-passant square off the board
+        self.assertRaises(ValueError, GameBoard.from_bytes, data)
@@ -0,0 +1,53 @@
+import unittest
+from src.chess.board import GameBoard
+from src.chess.database import PositionDatabase, position_hash, material_signature
+
+
+class TestPositionDatabase(unittest.TestCase):
+    """
+    Test PositionDatabase class
+    """
+    def setUp(self):
+        self.db = PositionDatabase()
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_material_signature(self):
+        gb = GameBoard()
+        self.assertEqual(material_signature(gb), 'KQRRBBNNPPPPPPPPvKQRRBBNNPPPPPPPP')
+
+        gb['D1'] = None
+        gb['A7'] = None
+        self.assertEqual(material_signature(gb), 'KRRBBNNPPPPPPPPvKQRRBBNNPPPPPPP')
+
+    def test_position_hash(self):
+        gb = GameBoard()
+        self.assertEqual(position_hash(gb), position_hash(GameBoard()))
+        self.assertNotEqual(position_hash(gb), position_hash(GameBoard(turn='black')))
+
+    def test_games_with_position(self):
+        game1 = self.db.add_game([('E2', 'E4'), ('E7', 'E5')], white='a', black='b')
+        game2, game3 = self.db.add_games([
+            {'moves': [('E2', 'E4'), ('D7', 'D5')]},
+            {'moves': [('d2', 'd4')], 'result': '1-0'},
+        ])
+
+        gb = GameBoard()
+        self.assertListEqual(self.db.games_with_position(gb), [game1, game2, game3])
+
+        gb['E4'], gb['E2'] = gb['E2'], None
+        gb.turn = 'black'
+        self.assertListEqual(self.db.games_with_position(gb), [])  # en-passant square differs
+        gb.en_passant = 'E3'
+        self.assertListEqual(self.db.games_with_position(gb), [game1, game2])
+
+        self.assertEqual(self.db.get_game(game3)['moves'], [('D2', 'D4')])
+        self.assertEqual(self.db.get_game(game3)['result'], '1-0')
+        self.assertIsNone(self.db.get_game(100))
+
+    def test_positions_with_material(self):
+        game = self.db.add_game([('E2', 'E4'), ('D7', 'D5'), ('E4', 'D5')])
+        signature = 'KQRRBBNNPPPPPPPPvKQRRBBNNPPPPPPP'
+        self.assertListEqual(self.db.positions_with_material(signature), [(game, 3)])
+        self.assertListEqual(self.db.positions_with_material(signature, turn='white'), [])
@@ -0,0 +1,66 @@
+import unittest
+from src.chess.board import GameBoard
+from src.chess.engine import evaluate, search, static_exchange_eval, MATE_SCORE
+from src.chess.pieces import King, Queen, Rook, Knight, Pawn
+
+
+class TestEngine(unittest.TestCase):
+    """
+    Test engine module
+    """
+    def test_evaluate(self):
+        gb = GameBoard()
+        self.assertEqual(evaluate(gb), 0)
+
+        gb['D8'] = None  # black loses the queen
+        self.assertEqual(evaluate(gb), 900)
+        gb.turn = 'black'
+        self.assertEqual(evaluate(gb), -900)
+
+    def test_search_capture(self):
+        gb = GameBoard()
+        gb['D4'] = Queen('black')  # free queen for the pawn on E3
+        gb['E3'] = gb['E2']
+        gb['E2'] = None
+        score, move = search(gb, 1)
+        self.assertEqual(move.to_location, 'D4')
+        self.assertEqual(move.from_location, 'E3')
+
+    def test_search_king_capture(self):
+        gb = GameBoard()
+        for location in gb.keys():
+            gb[location] = None
+        gb['A1'] = King('white')
+        gb['B2'] = Queen('white')
+        gb['C3'] = King('black')
+        score, move = search(gb, 2)
+        self.assertEqual(score, MATE_SCORE)
+        self.assertEqual(move.to_location, 'C3')
+
+    def test_static_exchange_eval(self):
+        gb = GameBoard()
+        for location in gb.keys():
+            gb[location] = None
+        gb['E1'] = King('white')
+        gb['E8'] = King('black')
+        gb['D5'] = Pawn('black')
+        gb['E4'] = Pawn('white')
+        gb['C3'] = Knight('white')
+        self.assertEqual(static_exchange_eval(gb, 'E4', 'D5'), 100)  # undefended pawn
+
+        gb['F6'] = Knight('black')
+        self.assertEqual(static_exchange_eval(gb, 'E4', 'D5'), 100)  # pawn for pawn, knights are not traded
+        self.assertEqual(static_exchange_eval(gb, 'C3', 'D5'), 100)  # pawn recaptures after the knights are traded
+        gb['E4'] = None
+        self.assertEqual(static_exchange_eval(gb, 'C3', 'D5'), -220)  # knight for pawn
+
+        # x-ray: rook behind the rook joins the exchange
+        gb['D1'] = Rook('white')
+        gb['D2'] = Rook('white')
+        gb['D8'] = Rook('black')
+        gb['F6'] = None
+        gb['C3'] = None
+        self.assertEqual(static_exchange_eval(gb, 'D2', 'D5'), 100)
+        gb['D7'] = Rook('black')
+        self.assertEqual(static_exchange_eval(gb, 'D2', 'D5'), -400)
+        self.assertIsInstance(gb['D2'], Rook)  # board is not modified
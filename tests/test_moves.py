@@ -1,6 +1,8 @@
 import unittest
+from unittest import mock
 from src.chess.board import GameBoard
-from src.chess.moves import GameMoves
+from src.chess.moves import GameMoves, move_tables
+from src.chess.pieces import Pawn
 
 
 class TestGameMoves(unittest.TestCase):
@@ -22,3 +24,94 @@ class TestGameMoves(unittest.TestCase):
         self.gb[new_location] = pawn  # create new white pawn
         attacks = GameMoves._pawn_attack_moves(self.gb, pawn, new_location)
         self.assertSetEqual(attacks, set(['C7', 'E7']))  # 2 attacks
+
+    def test_get_all_moves(self):
+        # Test GameMoves.get_all_moves
+        moves = GameMoves.get_all_moves(self.gb, 'white')
+        self.assertSetEqual(moves, {col + row for col in GameBoard.cols for row in '34'})
+
+    def test_iter_moves(self):
+        # Test GameMoves.iter_moves
+        moves = list(GameMoves.iter_moves(self.gb, 'white'))
+        self.assertEqual(len(moves), 20)  # 16 pawn moves and 4 knight moves
+        self.assertTrue(all(move.capture is None for move in moves))
+
+        # captures are generated before quiet moves
+        self.gb['D6'] = self.gb['D2']
+        first = next(GameMoves.iter_moves(self.gb, 'white'))
+        self.assertEqual(first.from_location, 'D6')
+        self.assertIn(first.to_location, {'C7', 'E7'})
+        self.assertIsInstance(first.capture, Pawn)
+
+    def test_iter_moves_lazy(self):
+        # Test GameMoves.iter_moves stops generating once the consumer stops
+        with mock.patch.object(GameMoves, 'get_moves', wraps=GameMoves.get_moves) as get_moves:
+            moves = GameMoves.iter_moves(self.gb, 'white')
+            next(moves)
+            # no captures: only moves of the A1 rook (none) and the B1 knight are generated, not all 16 pieces
+            self.assertEqual(get_moves.call_count, 2)
+
+        # captures found in the first stage are the same as those found by get_moves
+        self.gb['D6'] = self.gb['D2']
+        self.gb['E3'] = self.gb['D8']
+        captures = {(move.from_location, move.to_location) for move in GameMoves.iter_moves(self.gb, 'white')
+                    if move.capture is not None}
+        expected = {(location, new_location) for location, piece in self.gb.items()
+                    if piece is not None and piece.color == 'white'
+                    for new_location in GameMoves.get_moves(self.gb, location) if self.gb[new_location] is not None}
+        self.assertSetEqual(captures, expected)
+        self.assertIn(('F2', 'E3'), captures)
+
+    def test_iter_moves_en_passant(self):
+        # Test en-passant flags and captures
+        GameMoves.move(self.gb, 'E2', 'E4')
+        GameMoves.move(self.gb, 'A7', 'A6')
+        GameMoves.move(self.gb, 'E4', 'E5')
+        GameMoves.move(self.gb, 'D7', 'D5')
+        moves = {move.to_location: move for move in GameMoves.iter_moves(self.gb, 'white')
+                 if move.from_location == 'E5'}
+        self.assertTupleEqual(moves['D6'].flags, ('en_passant',))
+        self.assertIs(moves['D6'].capture, self.gb['D5'])
+
+        GameMoves.move(self.gb, 'E5', 'D6')
+        self.assertIsNone(self.gb['D5'])  # captured pawn is removed
+
+    def test_has_moves(self):
+        # Test GameMoves.has_moves
+        self.assertTrue(GameMoves.has_moves(self.gb, 'white'))
+        for location in self.gb.keys():
+            if self.gb[location] and self.gb[location].color == 'white':
+                self.gb[location] = None
+        self.assertFalse(GameMoves.has_moves(self.gb, 'white'))
+
+    def test_get_moves_cache(self):
+        # Test memoization of GameMoves.get_moves
+        self.assertSetEqual(GameMoves.get_moves(self.gb, 'E2'), {'E3', 'E4'})
+        GameMoves.get_moves(self.gb, 'E2').add('E5')  # returned set is a copy
+        self.assertSetEqual(GameMoves.get_moves(self.gb, 'E2'), {'E3', 'E4'})
+        self.assertGreater(self.gb.move_cache.hits, 0)
+
+        # cache is invalidated by board changes
+        self.gb['E4'] = self.gb['E7']
+        self.assertSetEqual(GameMoves.get_moves(self.gb, 'E2'), {'E3'})
+        GameMoves.move(self.gb, 'E2', 'E3')
+        self.assertSetEqual(GameMoves.get_moves(self.gb, 'E3'), set())
+
+    def test_move_copy(self):
+        # Test GameMoves.move does not modify pieces shared with a copied board
+        gb2 = self.gb.copy()
+        GameMoves.move(gb2, 'E2', 'E4')
+        self.assertTrue(gb2['E4'].has_moved)
+        self.assertFalse(self.gb['E2'].has_moved)
+        self.assertIsNone(self.gb['E4'])
+        self.assertListEqual(self.gb.history, [])
+        self.assertEqual(len(gb2.history), 1)
+
+    def test_move_tables(self):
+        # Test lookup tables used by move generation
+        tables = move_tables()
+        self.assertSetEqual(set(tables['knight']['A1']), {'B3', 'C2'})
+        self.assertEqual(len(tables['king']['E4']), 8)
+        self.assertTupleEqual(tables['rays']['A1'][1, 1], ('B2', 'C3', 'D4', 'E5', 'F6', 'G7', 'H8'))
+        self.assertTupleEqual(tables['rays']['A1'][-1, 0], ())
+        self.assertIs(move_tables(), tables)  # built only once
@@ -0,0 +1,23 @@
+import subprocess
+import sys
+import unittest
+
+
+class TestPackage(unittest.TestCase):
+    """
+    Test package imports
+    """
+    def run_python(self, code):
+        # run in a fresh interpreter: other tests have already imported the submodules
+        return subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, universal_newlines=True,
+                              check=True).stdout.split()
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'submodules are imported eagerly before Python 3.7')
+    def test_lazy_import(self):
+        loaded = self.run_python('import sys, src.chess; print(*sorted(sys.modules))')
+        self.assertNotIn('src.chess.cli', loaded)
+        self.assertNotIn('src.chess.database', loaded)
+
+    def test_public_names(self):
+        output = self.run_python('from src.chess import GameBoard, Pawn; print(GameBoard.__name__, Pawn.__name__)')
+        self.assertListEqual(output, ['GameBoard', 'Pawn'])
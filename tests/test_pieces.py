@@ -39,3 +39,19 @@ class TestPieces(unittest.TestCase):
 
         pawn = pieces.Pawn(color='white')
         self.assertEqual(pawn.name, 'pawn')
+
+    def test_immutable(self):
+        # Pieces are shared between copies of a board, so they cannot be modified
+        pawn = pieces.Pawn(color='white')
+        self.assertRaises(AttributeError, setattr, pawn, 'has_moved', True)
+        self.assertRaises(AttributeError, setattr, pawn, 'color', 'black')
+        self.assertFalse(pawn.has_moved)
+        self.assertEqual(pawn.color, 'white')
+
+    def test_shared(self):
+        pawn = pieces.Pawn.shared('white')
+        self.assertIs(pieces.Pawn.shared('white'), pawn)
+        self.assertIsNot(pieces.Pawn.shared('white', has_moved=True), pawn)
+        self.assertIsNot(pieces.Knight.shared('white'), pawn)
+        self.assertTrue(pieces.Pawn.shared('black', has_moved=True).has_moved)
+        self.assertRaises(ValueError, pieces.Pawn.shared, 'green')
@@ -0,0 +1,65 @@
+import math
+import os
+import tempfile
+import unittest
+from src.chess.tournament import GameResult, elo_difference, load_openings, play_game, run_tournament, score, sprt, \
+    to_pgn
+
+
+class TestTournament(unittest.TestCase):
+    """
+    Test tournament module
+    """
+    def test_play_game(self):
+        result, moves = play_game(1, 1, opening=('e2e4', 'e7e5'), max_plies=6)
+        self.assertEqual(result, '1/2-1/2')
+        self.assertEqual(len(moves), 6)
+        self.assertListEqual(moves[:2], ['e2e4', 'e7e5'])
+
+    def test_play_game_seed(self):
+        games = {tuple(play_game(1, 1, max_plies=10, seed=seed)[1]) for seed in range(4)}
+        self.assertGreater(len(games), 1)
+        self.assertEqual(play_game(1, 1, max_plies=10, seed=1), play_game(1, 1, max_plies=10, seed=1))
+
+    def test_load_openings(self):
+        fd, path = tempfile.mkstemp(suffix='.txt')
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, 'w') as fo:
+            fo.write('# comment\ne2e4 e7e5\n\nd2d4 d7d5 c2c4\n')
+        self.assertListEqual(load_openings(path), [('e2e4', 'e7e5'), ('d2d4', 'd7d5', 'c2c4')])
+
+        with open(path, 'a') as fo:
+            fo.write('e2e5\n')
+        with self.assertRaises(ValueError):
+            load_openings(path)
+
+    def test_run_tournament_no_openings(self):
+        with self.assertRaises(ValueError):
+            run_tournament(1, 1, 2, [])
+
+    def test_score(self):
+        results = [
+            GameResult(1, 'A', 'B', '1-0', ()),
+            GameResult(2, 'B', 'A', '1-0', ()),
+            GameResult(3, 'A', 'B', '1/2-1/2', ()),
+            GameResult(4, 'B', 'A', '0-1', ()),
+        ]
+        self.assertTupleEqual(score(results), (2, 1, 1))
+        self.assertTupleEqual(score(results, 'B'), (1, 1, 2))
+
+    def test_elo_difference(self):
+        self.assertEqual(elo_difference(5, 0, 5), 0)
+        self.assertAlmostEqual(elo_difference(3, 0, 1), 190.8, places=1)
+        self.assertEqual(elo_difference(1, 0, 0), math.inf)
+
+    def test_sprt(self):
+        llr, lower, upper = sprt(100, 0, 100)
+        self.assertLess(llr, 0)
+        self.assertAlmostEqual(lower, -2.94, places=2)
+        self.assertAlmostEqual(upper, 2.94, places=2)
+        self.assertGreater(sprt(600, 100, 300)[0], upper)
+
+    def test_to_pgn(self):
+        pgn = to_pgn(GameResult(1, 'A', 'B', '0-1', ('e2e4', 'e7e5', 'd2d4')))
+        self.assertIn('[Result "0-1"]', pgn)
+        self.assertTrue(pgn.endswith('1. e2e4 e7e5 2. d2d4 0-1\n'))
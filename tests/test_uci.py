@@ -0,0 +1,89 @@
+import io
+import unittest
+from src.chess.pieces import Queen
+from src.chess.uci import UCIEngine
+
+
+class TestUCIEngine(unittest.TestCase):
+    """
+    Test UCIEngine class
+    """
+    def setUp(self):
+        self.output = io.StringIO()
+        self.engine = UCIEngine(output=self.output)
+
+    def lines(self):
+        return self.output.getvalue().splitlines()
+
+    def test_handshake(self):
+        self.engine.run(['uci', 'isready', 'quit'])
+        self.assertEqual(self.lines()[-2:], ['uciok', 'readyok'])
+
+    def test_position(self):
+        self.engine.handle('position startpos moves e2e4 e7e5')
+        self.assertIsNotNone(self.engine.board['E4'])
+        self.assertIsNotNone(self.engine.board['E5'])
+        self.assertEqual(self.engine.board.turn, 'white')
+
+    def test_go_depth(self):
+        self.engine.run(['position startpos moves e2e4', 'go depth 1'])
+        self.assertTrue(self.lines()[-1].startswith('bestmove '))
+
+    def test_infinite_stop(self):
+        self.engine.handle('go infinite')
+        self.engine.handle('isready')  # answered while searching
+        self.assertIn('readyok', self.lines())
+        self.engine.handle('stop')
+        self.assertTrue(self.lines()[-1].startswith('bestmove '))
+
+    def test_ponderhit(self):
+        self.engine.handle('go ponder depth 1')
+        self.engine.handle('ponderhit')  # depth limited search may now report its best move
+        self.engine._worker.join(timeout=10)
+        self.assertTrue(self.lines()[-1].startswith('bestmove '))
+
+    def test_position_invalid(self):
+        # castling is not supported, so the position cannot be reproduced
+        self.engine.run(['position startpos moves e2e4 e7e5 g1f3 b8c6 f1c4 g8f6 e1g1', 'go depth 1'])
+        self.assertIsNone(self.engine.board)
+        self.assertEqual(self.lines()[-1], 'bestmove 0000')
+
+        self.engine.run(['position startpos moves e2e4', 'go depth 1'])
+        self.assertNotEqual(self.lines()[-1], 'bestmove 0000')
+
+    def test_position_promotion(self):
+        moves = 'a2a4 b7b5 a4b5 a7a6 b5a6 c8b7 a6b7 h7h6 b7a8q'
+        self.engine.handle(f'position startpos moves {moves}')
+        self.assertIsInstance(self.engine.board['A8'], Queen)
+        self.assertEqual(self.engine.board['A8'].color, 'white')
+
+        self.engine.handle('position startpos moves e2e4q')  # not a promotion
+        self.assertIsNone(self.engine.board)
+
+    def test_go_invalid_option(self):
+        self.engine.run(['go depth abc movetime 10'])
+        self.assertIn('info string ignoring go depth abc', self.lines())
+        self.assertTrue(self.lines()[-1].startswith('bestmove '))
+
+    def test_handshake_options(self):
+        self.engine.handle('uci')
+        self.assertIn('option name Ponder type check default true', self.lines())
+
+    def test_mate_score(self):
+        # fool's mate: black takes the king next move
+        self.engine.handle('position startpos moves f2f3 e7e5 g2g4 d8h4 a2a3')
+        self.engine.handle('go depth 1')
+        self.engine._worker.join(timeout=10)
+        self.assertIn('info depth 1 score mate 1 pv h4e1', self.lines())
+
+        self.engine.handle('position startpos moves f2f3 e7e5 g2g4 d8h4')
+        self.engine.handle('go depth 2')
+        self.engine._worker.join(timeout=10)
+        self.assertTrue(self.lines()[-2].startswith('info depth 2 score mate -1 pv '))
+
+    def test_ponderhit_without_time_limit(self):
+        self.engine.handle('go ponder')
+        self.engine.handle('ponderhit')  # falls back to the depth of a plain "go"
+        self.engine._worker.join(timeout=30)
+        self.assertFalse(self.engine._worker.is_alive())
+        self.assertTrue(self.lines()[-1].startswith('bestmove '))